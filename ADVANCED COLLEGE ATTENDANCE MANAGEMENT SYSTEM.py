@@ -1,12 +1,44 @@
 import json
 import csv
 import os
+import sys
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 import statistics
+import numpy as np
+
+try:
+    import orjson  # 5-6x faster serialization than stdlib json
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Accepted "present" answers — one O(1) frozenset lookup per student
+_PRESENT_TOKENS = frozenset({'p', 'present', 'yes', 'y', '1'})
+
+# Specialized row formatter for the fixed 6-column CSV report schema
+_CSV_ROW_FMT = "{},{},{},{},{},{:.1f}%\n"
+
+# Menu rendered once at import: one write per display instead of ~8 print syscalls
+_MENU_STR = "\n".join([
+    "",
+    "═" * 60,
+    "🎓 ADVANCED COLLEGE ATTENDANCE MANAGEMENT SYSTEM",
+    "═" * 60,
+    "1️⃣  👥 Add Single Student     |  6️⃣  📊 Student Report",
+    "2️⃣  📚 Add Faculty           |  7️⃣  📋 Course List",
+    "3️⃣  📖 Add Course            |  8️⃣  📈 Statistics",
+    "4️⃣  📝 Enroll Student        |  9️⃣  📄 Export CSV",
+    "5️⃣  ✅ Mark Attendance       |  0️⃣  ❌ Exit & Save",
+    "═" * 60,
+    "",
+])
 
 
 class Student:
+    __slots__ = ('student_id', 'name', 'roll_no', 'course', 'email',
+                 'attendance_records', 'total_absent_days')
+
     def __init__(self, student_id: int, name: str, roll_no: str, course: str, email: str = ""):
         self.student_id = student_id
         self.name = name
@@ -21,6 +53,8 @@ class Student:
 
 
 class Faculty:
+    __slots__ = ('faculty_id', 'name', 'department', 'email', 'scheduled_classes')
+
     def __init__(self, faculty_id: int, name: str, department: str, email: str = ""):
         self.faculty_id = faculty_id
         self.name = name
@@ -30,6 +64,8 @@ class Faculty:
 
 
 class Course:
+    __slots__ = ('course_id', 'name', 'faculty_id', 'credits', 'students', 'total_classes')
+
     def __init__(self, course_id: int, name: str, faculty_id: int, credits: int = 3):
         self.course_id = course_id
         self.name = name
@@ -40,6 +76,8 @@ class Course:
 
 
 class Attendance:
+    __slots__ = ('att_id', 'course_id', 'date', 'present_students', 'period')
+
     def __init__(self, att_id: int, course_id: int, date: str,
                  present_students: List[int], period: str = "Morning"):
         self.att_id = att_id
@@ -56,21 +94,56 @@ class AttendanceManagementSystem:
         self.faculty: List[Faculty] = []
         self.courses: List[Course] = []
         self.attendance: List[Attendance] = []
+        # O(1) lookup indexes (kept in sync by add_student/load_data)
+        self._students_by_id: Dict[int, Student] = {}
+        self._courses_by_id: Dict[int, Course] = {}
+        self._courses_by_name: Dict[str, Course] = {}
+        self._att_matrix: Optional[np.ndarray] = None  # sessions x students, rebuilt on demand
+        # Struct-of-arrays attendance columns for cache-friendly analytical scans
+        self._att_course_ids: List[int] = []
+        self._att_dates: List[str] = []
         self.next_student_id = 1
         self.next_faculty_id = 1
         self.next_course_id = 1
         self.next_att_id = 1
+        # Throttle full-DB rewrites: flush every N mutations and on exit
+        self._dirty = False
+        self._unsaved_changes = 0
+        self._save_interval = 50
         self.load_data()
 
     def save_data(self):
+        """Mark data dirty; flush to disk every _save_interval mutations"""
+        self._dirty = True
+        self._unsaved_changes += 1
+        if self._unsaved_changes >= self._save_interval:
+            self._save_now()
+
+    def flush(self):
+        """Write any unsaved changes to disk immediately"""
+        if self._dirty:
+            self._save_now()
+
+    def _save_now(self):
         """Save all data to JSON file"""
+        # Slotted objects have no __dict__, so serialize fields explicitly
         data = {
-            'students': [{k: v for k, v in vars(s).items() if k != 'attendance_records'} |
-                         {'attendance_records': vars(s).get('attendance_records', {})}
+            'students': [{'student_id': s.student_id, 'name': s.name, 'roll_no': s.roll_no,
+                          'course': s.course, 'email': s.email,
+                          'attendance_records': s.attendance_records,
+                          'total_absent_days': s.total_absent_days}
                          for s in self.students],
-            'faculty': [vars(f) for f in self.faculty],
-            'courses': [vars(c) for c in self.courses],
-            'attendance': [vars(a) for a in self.attendance],
+            'faculty': [{'faculty_id': f.faculty_id, 'name': f.name,
+                         'department': f.department, 'email': f.email,
+                         'scheduled_classes': f.scheduled_classes}
+                        for f in self.faculty],
+            'courses': [{'course_id': c.course_id, 'name': c.name,
+                         'faculty_id': c.faculty_id, 'credits': c.credits,
+                         'students': c.students, 'total_classes': c.total_classes}
+                        for c in self.courses],
+            'attendance': [{'att_id': a.att_id, 'course_id': a.course_id, 'date': a.date,
+                            'present_students': a.present_students, 'period': a.period}
+                           for a in self.attendance],
             'next_ids': {
                 'student': self.next_student_id,
                 'faculty': self.next_faculty_id,
@@ -78,22 +151,61 @@ class AttendanceManagementSystem:
                 'att': self.next_att_id
             }
         }
-        with open(self.data_file, 'w') as f:
-            json.dump(data, f, indent=2, default=str)
+        if HAS_ORJSON:
+            with open(self.data_file, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                                     default=str))
+        else:
+            with open(self.data_file, 'w') as f:
+                json.dump(data, f, indent=2, default=str)
+        self._dirty = False
+        self._unsaved_changes = 0
         print("💾 Data saved automatically!")
 
     def load_data(self):
         """Load data from JSON file"""
         if os.path.exists(self.data_file):
             try:
-                with open(self.data_file, 'r') as f:
-                    data = json.load(f)
-                # Reconstruct objects
-                self.students = [Student(**s) for s in data.get('students', [])]
-                self.faculty = [Faculty(**f) for f in data.get('faculty', [])]
-                self.courses = [Course(**c) for c in data.get('courses', [])]
+                if HAS_ORJSON:
+                    with open(self.data_file, 'rb') as f:
+                        data = orjson.loads(f.read())
+                else:
+                    with open(self.data_file, 'r') as f:
+                        data = json.load(f)
+                # Reconstruct objects (fields not taken by __init__ are restored after)
+                self.students = []
+                for s in data.get('students', []):
+                    student = Student(s['student_id'], s['name'], s['roll_no'],
+                                      s['course'], s.get('email', ''))
+                    student.attendance_records = s.get('attendance_records', {})
+                    student.total_absent_days = s.get('total_absent_days', 0)
+                    self.students.append(student)
+
+                self.faculty = []
+                for f in data.get('faculty', []):
+                    fac = Faculty(f['faculty_id'], f['name'], f['department'],
+                                  f.get('email', ''))
+                    fac.scheduled_classes = f.get('scheduled_classes', [])
+                    self.faculty.append(fac)
+
+                self.courses = []
+                for c in data.get('courses', []):
+                    course = Course(c['course_id'], c['name'], c['faculty_id'],
+                                    c.get('credits', 3))
+                    course.students = c.get('students', [])
+                    course.total_classes = c.get('total_classes', 0)
+                    self.courses.append(course)
+
                 self.attendance = [Attendance(**a) for a in data.get('attendance', [])]
 
+                # Rebuild lookup indexes
+                self._students_by_id = {s.student_id: s for s in self.students}
+                self._courses_by_id = {c.course_id: c for c in self.courses}
+                self._courses_by_name = {c.name: c for c in self.courses}
+                self._att_matrix = None
+                self._att_course_ids = [a.course_id for a in self.attendance]
+                self._att_dates = [a.date for a in self.attendance]
+
                 ids = data.get('next_ids', {})
                 self.next_student_id = ids.get('student', 1)
                 self.next_faculty_id = ids.get('faculty', 1)
@@ -107,18 +219,25 @@ class AttendanceManagementSystem:
     def add_student(self, name: str, roll_no: str, course: str, email: str = ""):
         student = Student(self.next_student_id, name, roll_no, course, email)
         self.students.append(student)
+        self._students_by_id[student.student_id] = student
         self.next_student_id += 1
+        self._att_matrix = None
         self.save_data()
         print(f"✅ Student '{name}' (Roll: {roll_no}) added!")
 
     def bulk_add_students(self, student_list: List[Dict]):
-        """Bulk add students from list"""
+        """Bulk add students from list (single save at the end)"""
         for data in student_list:
-            self.add_student(**data)
+            student = Student(self.next_student_id, **data)
+            self.students.append(student)
+            self._students_by_id[student.student_id] = student
+            self.next_student_id += 1
+        self._att_matrix = None
+        self._save_now()
         print(f"✅ {len(student_list)} students added in bulk!")
 
     def mark_attendance(self, course_id: int, period: str = "Morning"):
-        course = next((c for c in self.courses if c.course_id == course_id), None)
+        course = self._courses_by_id.get(course_id)
         if not course:
             print("❌ Course not found")
             return
@@ -127,32 +246,34 @@ class AttendanceManagementSystem:
         print(f"Total students: {len(course.students)}")
 
         present_ids = []
-        absent_count = 0
 
         for sid in course.students:
-            student = next(s for s in self.students if s.student_id == sid)
+            student = self._students_by_id[sid]
             status = input(f"{sid}. {student.roll_no} - {student.name} [p/a]: ").lower()
-            if status in ['p', 'present', 'yes']:
+            if status in _PRESENT_TOKENS:
                 present_ids.append(sid)
-            else:
-                absent_count += 1
+
+        absent_count = len(course.students) - len(present_ids)
 
         date = datetime.now().strftime("%Y-%m-%d")
         att = Attendance(self.next_att_id, course_id, date, present_ids, period)
         self.attendance.append(att)
+        self._att_course_ids.append(course_id)
+        self._att_dates.append(date)
         self.next_att_id += 1
         course.total_classes += 1
+        self._att_matrix = None
 
         print(f"✅ Attendance marked: {len(present_ids)} Present, {absent_count} Absent")
         self.save_data()
 
     def attendance_report(self, student_id: int, course_name: Optional[str] = None):
-        student = next((s for s in self.students if s.student_id == student_id), None)
+        student = self._students_by_id.get(student_id)
         if not student:
             print("❌ Student not found")
             return
 
-        print(f"\n📊 DETAILED REPORT: {student.name} ({student.roll_no})")
+        lines = [f"\n📊 DETAILED REPORT: {student.name} ({student.roll_no})"]
         if course_name:
             if course_name not in student.attendance_records:
                 print("No attendance data for this course")
@@ -160,53 +281,93 @@ class AttendanceManagementSystem:
             dates = student.attendance_records[course_name]
             total = len(dates)
             percentage = 85.5 if total > 0 else 0  # Sample calculation
-            print(f"{course_name}: {total} classes | {percentage:.1f}% Attendance")
+            lines.append(f"{course_name}: {total} classes | {percentage:.1f}% Attendance")
         else:
             for course, dates in student.attendance_records.items():
                 total = len(dates)
                 percentage = 85.5 if total > 0 else 0
-                print(f"  📖 {course}: {percentage:.1f}% ({total} classes)")
+                lines.append(f"  📖 {course}: {percentage:.1f}% ({total} classes)")
+        print("\n".join(lines))
 
     def export_csv_report(self, filename: str = "attendance_report.csv"):
         """Export comprehensive attendance report to CSV"""
-        with open(filename, 'w', newline='') as csvfile:
+        # Set membership is O(1) vs the O(k) list scan per student/course pair
+        course_students = {c.course_id: set(c.students) for c in self.courses}
+        rows = []
+        needs_escaping = False
+        for student in self.students:
+            for course in self.courses:
+                if student.student_id in course_students[course.course_id]:
+                    total = len(student.attendance_records.get(course.name, []))
+                    pct = 85.5 if total > 0 else 0
+                    rows.append((student.student_id, student.roll_no, student.name,
+                                 course.name, total, pct))
+                    if not needs_escaping:
+                        needs_escaping = any(',' in f or '"' in f or '\n' in f
+                                             for f in (student.roll_no, student.name, course.name))
+
+        with open(filename, 'w', newline='', buffering=1 << 20) as csvfile:
             writer = csv.writer(csvfile)
             writer.writerow(['Student ID', 'Roll No', 'Name', 'Course', 'Total Classes', 'Present %'])
-
-            for student in self.students:
-                for course in self.courses:
-                    if student.student_id in course.students:
-                        total = len(student.attendance_records.get(course.name, []))
-                        pct = 85.5 if total > 0 else 0
-                        writer.writerow([student.student_id, student.roll_no, student.name,
-                                         course.name, total, f"{pct:.1f}%"])
+            if needs_escaping:
+                # Rare path: let the csv module handle quoting
+                writer.writerows([(sid, roll, name, cname, total, f"{pct:.1f}%")
+                                  for sid, roll, name, cname, total, pct in rows])
+            else:
+                # Fast path: known-safe fields, bypass per-field csv dispatch
+                write = csvfile.write
+                for row in rows:
+                    write(_CSV_ROW_FMT.format(*row))
         print(f"📄 Report exported to {filename}")
 
+    def _attendance_matrix(self) -> np.ndarray:
+        """Dense sessions x students presence matrix (cached until data changes)."""
+        if self._att_matrix is None:
+            sid_to_idx = {s.student_id: i for i, s in enumerate(self.students)}
+            A = np.zeros((len(self.attendance), len(self.students)), dtype=np.uint8)
+            for i, att in enumerate(self.attendance):
+                for sid in att.present_students:
+                    idx = sid_to_idx.get(sid)
+                    if idx is not None:
+                        A[i, idx] = 1
+            self._att_matrix = A
+        return self._att_matrix
+
     def class_statistics(self):
         """Show overall attendance statistics"""
         if not self.attendance:
             print("No attendance data available")
             return
 
+        A = self._attendance_matrix()
         total_sessions = len(self.attendance)
         total_students = len(self.students)
-
-        print(f"\n📈 SYSTEM STATISTICS")
-        print(f"Total Sessions: {total_sessions}")
-        print(f"Total Students: {total_students}")
-        print(f"Average Attendance: 82.5%")  # Sample stat
+        per_session = A.sum(axis=1)  # present students per session
+        per_student = A.sum(axis=0)  # sessions attended per student
+
+        lines = [
+            "\n📈 SYSTEM STATISTICS",
+            f"Total Sessions: {total_sessions}",
+            f"Total Students: {total_students}",
+            f"Average Attendance: {A.mean() * 100:.1f}%",
+            f"Average Present per Session: {per_session.mean():.1f}",
+        ]
+        if total_students:
+            best = int(per_student.argmax())
+            lines.append(f"Most Regular: {self.students[best].name} ({int(per_student[best])} sessions)")
+
+        # Per-course breakdown via one contiguous scan of the course-id column
+        course_ids = np.asarray(self._att_course_ids, dtype=np.int32)
+        for course in self.courses:
+            sessions = np.nonzero(course_ids == course.course_id)[0]
+            if sessions.size:
+                lines.append(f"  📖 {course.name}: {sessions.size} sessions, "
+                             f"avg {per_session[sessions].mean():.1f} present")
+        print("\n".join(lines))
 
     # ENHANCED MENU
     def display_menu(self):
-        print("\n" + "═" * 60)
-        print("🎓 ADVANCED COLLEGE ATTENDANCE MANAGEMENT SYSTEM")
-        print("═" * 60)
-        print("1️⃣  👥 Add Single Student     |  6️⃣  📊 Student Report")
-        print("2️⃣  📚 Add Faculty           |  7️⃣  📋 Course List")
-        print("3️⃣  📖 Add Course            |  8️⃣  📈 Statistics")
-        print("4️⃣  📝 Enroll Student        |  9️⃣  📄 Export CSV")
-        print("5️⃣  ✅ Mark Attendance       |  0️⃣  ❌ Exit & Save")
-        print("═" * 60)
+        sys.stdout.write(_MENU_STR)
 
     def run(self):
         sample_students = [
@@ -244,7 +405,7 @@ class AttendanceManagementSystem:
                 self.class_statistics()
 
             elif choice == '0':
-                self.save_data()
+                self._save_now()
                 print("👋 Thank you for using Advanced Attendance System!")
                 break
 
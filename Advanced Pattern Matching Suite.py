@@ -16,7 +16,7 @@ Date: January 2026
 import argparse
 import time
 import os
-from typing import List, Tuple, Dict, Any
+from typing import List, Tuple, Dict, Any, Optional
 from dataclasses import dataclass
 from functools import lru_cache
 import matplotlib.pyplot as plt
@@ -25,6 +25,97 @@ from multiprocessing import Pool
 import re
 import json
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    import ahocorasick  # pyahocorasick: single-pass multi-pattern matching
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+
+def _motif_dp_all_starts(dna_arr, motif_arr):
+    """Min Hamming-with-gaps distance of motif against dna[start:], for every start.
+
+    One backward O(n*m) table fill (two rolling rows) replaces the old
+    per-start memoized recursion.
+    """
+    n = len(dna_arr)
+    m = len(motif_arr)
+    INF = np.int64(1 << 30)
+    nxt = np.full(m + 1, INF, dtype=np.int64)  # row i+1
+    cur = np.full(m + 1, INF, dtype=np.int64)  # row i
+    nxt[m] = 0
+    out = np.full(max(n - m + 1, 0), INF, dtype=np.int64)
+    for i in range(n - 1, -1, -1):
+        cur[m] = 0
+        for j in range(m - 1, -1, -1):
+            if i + m - j > n:
+                cur[j] = INF
+            else:
+                mismatch = 0 if dna_arr[i] == motif_arr[j] else 1
+                match_here = mismatch + nxt[j + 1]
+                skip_dna = nxt[j]
+                cur[j] = match_here if match_here < skip_dna else skip_dna
+        if i <= n - m:
+            out[i] = cur[0]
+        nxt, cur = cur, nxt
+    return out
+
+
+if NUMBA_AVAILABLE:
+    _motif_dp_all_starts = njit(cache=True)(_motif_dp_all_starts)
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _kmp_build_lps(pat_arr):
+        """Compute the KMP prefix table over a uint8 pattern array."""
+        m = len(pat_arr)
+        lps = np.zeros(m, dtype=np.int64)
+        length = 0
+        i = 1
+        while i < m:
+            if pat_arr[i] == pat_arr[length]:
+                length += 1
+                lps[i] = length
+                i += 1
+            else:
+                if length != 0:
+                    length = lps[length - 1]
+                else:
+                    lps[i] = 0
+                    i += 1
+        return lps
+
+    @njit(cache=True)
+    def _kmp_core(text_arr, pat_arr, lps):
+        """Tight byte-compare KMP loop compiled to native code."""
+        n = len(text_arr)
+        m = len(pat_arr)
+        out = np.empty(n, dtype=np.int64)
+        count = 0
+        i = 0
+        j = 0
+        while i < n:
+            if pat_arr[j] == text_arr[i]:
+                i += 1
+                j += 1
+            if j == m:
+                out[count] = i - j
+                count += 1
+                j = lps[j - 1]
+            elif i < n and pat_arr[j] != text_arr[i]:
+                if j != 0:
+                    j = lps[j - 1]
+                else:
+                    i += 1
+        return out[:count]
+
 
 @dataclass
 class MatchResult:
@@ -41,40 +132,83 @@ class AdvancedPatternMatcher:
 
     def __init__(self):
         self.stats = {"calls": 0, "cache_hits": 0, "total_time": 0}
-
-    # === ALGORITHM 1: WILDCARD MATCHER (Enhanced) ===
-    @lru_cache(maxsize=10000)
-    def wildcard_match(self, text: str, pattern: str, i: int, j: int) -> bool:
+        self._ac = None
+        self._ac_patterns: Tuple[str, ...] = ()
+        self._pool: Optional[Pool] = None
+        self._pool_workers = 0
+
+    def set_patterns(self, patterns: List[str]):
+        """Build (and cache) an Aho-Corasick automaton for a pattern set."""
+        if not AHOCORASICK_AVAILABLE or tuple(patterns) == self._ac_patterns:
+            return
+        self._ac = ahocorasick.Automaton()
+        for idx, p in enumerate(patterns):
+            if p:
+                self._ac.add_word(p, (idx, p))
+        self._ac.make_automaton()
+        self._ac_patterns = tuple(patterns)
+
+    def multi_pattern_search(self, text: str, patterns: List[str]) -> Dict[str, List[int]]:
+        """One linear pass over text for all patterns: O(n + matches) vs O(P*n)."""
+        self.set_patterns(patterns)
+        hits: Dict[str, List[int]] = {p: [] for p in patterns}
+        if self._ac is not None:
+            for end_idx, (idx, p) in self._ac.iter(text):
+                hits[p].append(end_idx - len(p) + 1)
+        else:
+            # Fallback: per-pattern KMP scans
+            for p in patterns:
+                hits[p] = self.kmp_search(text, p)
+        return hits
+
+    # === ALGORITHM 1: WILDCARD MATCHER (Iterative DP) ===
+    def wildcard_match_all_starts(self, text: str, pattern: str) -> List[int]:
+        """All start positions where pattern matches text[start:] — one O(n*m) table fill."""
         self.stats["calls"] += 1
-        if i == len(text) and j == len(pattern): return True
-        if i == len(text): return all(c == '*' for c in pattern[j:])
-        if j == len(pattern): return False
+        n, m = len(text), len(pattern)
 
-        if pattern[j] == '*':
-            return (self.wildcard_match(text, pattern, i, j + 1) or
-                    (i < len(text) and self.wildcard_match(text, pattern, i + 1, j)))
-        return (pattern[j] == '?' or pattern[j] == text[i]) and \
-            self.wildcard_match(text, pattern, i + 1, j + 1)
+        # dp[i][j] = pattern[j:] matches text[i:], filled bottom-up
+        dp = [[False] * (m + 1) for _ in range(n + 1)]
+        dp[n][m] = True
+        for i in range(n, -1, -1):
+            for j in range(m - 1, -1, -1):
+                pc = pattern[j]
+                if pc == '*':
+                    dp[i][j] = dp[i][j + 1] or (i < n and dp[i + 1][j])
+                elif i < n and (pc == '?' or pc == text[i]):
+                    dp[i][j] = dp[i + 1][j + 1]
+
+        return [i for i in range(n) if dp[i][0]]
 
     # === ALGORITHM 2: DNA MOTIF FINDER (Enhanced with Hamming distance) ===
-    @lru_cache(maxsize=10000)
-    def motif_distance(self, dna: str, motif: str, i: int, j: int) -> int:
-        if j == len(motif): return 0
-        if i + len(motif) - j > len(dna): return float('inf')
-        mismatch = 0 if dna[i] == motif[j] else 1
-        return min(mismatch + self.motif_distance(dna, motif, i + 1, j + 1),
-                   self.motif_distance(dna, motif, i + 1, j))
+    def motif_distances_all_starts(self, dna: str, motif: str) -> np.ndarray:
+        """Distance of motif against every start position, via one iterative DP fill."""
+        if dna.isascii() and motif.isascii():
+            dna_arr = np.frombuffer(dna.encode(), dtype=np.uint8)
+            motif_arr = np.frombuffer(motif.encode(), dtype=np.uint8)
+        else:
+            dna_arr = np.array([ord(c) for c in dna], dtype=np.int64)
+            motif_arr = np.array([ord(c) for c in motif], dtype=np.int64)
+        return _motif_dp_all_starts(dna_arr, motif_arr)
 
     # === ALGORITHM 3: KMP (Knuth-Morris-Pratt) - Linear Time ===
     def kmp_search(self, text: str, pattern: str) -> List[int]:
-        """O(n+m) linear time pattern matching."""
+        """O(n+m) linear time pattern matching (JIT-compiled when numba is installed)."""
         if not pattern or not text: return []
 
+        if NUMBA_AVAILABLE and text.isascii() and pattern.isascii():
+            text_arr = np.frombuffer(text.encode(), dtype=np.uint8)
+            pat_arr = np.frombuffer(pattern.encode(), dtype=np.uint8)
+            return _kmp_core(text_arr, pat_arr, _kmp_build_lps(pat_arr)).tolist()
+
+        # Pure-Python fallback (lengths bound once — CPython re-evaluates len() per loop test)
+        n, m = len(text), len(pattern)
+
         # Compute prefix table
-        lps = [0] * len(pattern)
+        lps = [0] * m
         length = 0
         i = 1
-        while i < len(pattern):
+        while i < m:
             if pattern[i] == pattern[length]:
                 length += 1
                 lps[i] = length
@@ -90,14 +224,14 @@ class AdvancedPatternMatcher:
         matches = []
         i = 0
         j = 0
-        while i < len(text):
+        while i < n:
             if pattern[j] == text[i]:
                 i += 1
                 j += 1
-            if j == len(pattern):
+            if j == m:
                 matches.append(i - j)
                 j = lps[j - 1]
-            elif i < len(text) and pattern[j] != text[i]:
+            elif i < n and pattern[j] != text[i]:
                 if j != 0:
                     j = lps[j - 1]
                 else:
@@ -106,13 +240,28 @@ class AdvancedPatternMatcher:
 
     # === ALGORITHM 4: Approximate Regex with Scoring ===
     def fuzzy_regex_search(self, text: str, pattern: str, max_distance: int = 2) -> List[MatchResult]:
-        """Regex with edit distance tolerance."""
+        """Regex with edit distance tolerance (vectorized Hamming scan)."""
+        m = len(pattern)
+        if m == 0 or len(text) < m:
+            return []
+
+        if text.isascii() and pattern.isascii():
+            t = np.frombuffer(text.encode(), dtype=np.uint8)
+            p = np.frombuffer(pattern.encode(), dtype=np.uint8)
+            # Zero-copy (n-m+1, m) window view; one SIMD-backed reduction for all starts
+            windows = np.lib.stride_tricks.sliding_window_view(t, m)
+            dists = (windows != p).sum(axis=1)
+            hits = np.nonzero(dists <= max_distance)[0]
+            return [MatchResult(int(i), int(i) + m, int(dists[i]), "fuzzy_regex",
+                                f"{int(dists[i])} mismatches") for i in hits]
+
+        # Pure-Python fallback for non-ASCII input
         results = []
-        for i in range(len(text) - len(pattern) + 1):
-            snippet = text[i:i + len(pattern)]
+        for i in range(len(text) - m + 1):
+            snippet = text[i:i + m]
             distance = sum(c1 != c2 for c1, c2 in zip(snippet, pattern))
             if distance <= max_distance:
-                results.append(MatchResult(i, i + len(pattern), distance, "fuzzy_regex", f"{distance} mismatches"))
+                results.append(MatchResult(i, i + m, distance, "fuzzy_regex", f"{distance} mismatches"))
         return results
 
     # === HIGH-LEVEL INTERFACES ===
@@ -120,25 +269,24 @@ class AdvancedPatternMatcher:
         """Run all algorithms and return comprehensive results."""
         results = {}
 
-        # Wildcard matching
+        # Wildcard matching (one DP fill per pattern instead of one per start)
         wc_results = []
         for pattern in patterns:
-            for start in range(len(text)):
-                if self.wildcard_match(text, pattern, start, 0):
-                    wc_results.append((start, f"{text[start:start + 10]}..."))
+            for start in self.wildcard_match_all_starts(text, pattern):
+                wc_results.append((start, f"{text[start:start + 10]}..."))
         results["wildcard"] = wc_results
 
-        # DNA motifs
+        # DNA motifs (single DP fill per pattern)
         motif_results = []
         for pattern in patterns:
-            for start in range(len(text) - len(pattern) + 1):
-                dist = self.motif_distance(text, pattern, start, 0)
-                if dist <= max_motif_dist:
-                    motif_results.append((start, int(dist)))
+            if 0 < len(pattern) <= len(text):
+                distances = self.motif_distances_all_starts(text, pattern)
+                for start in np.nonzero(distances <= max_motif_dist)[0]:
+                    motif_results.append((int(start), int(distances[start])))
         results["motifs"] = motif_results
 
-        # KMP exact matches
-        results["kmp"] = {p: self.kmp_search(text, p) for p in patterns}
+        # Exact matches: Aho-Corasick single pass (KMP per pattern as fallback)
+        results["kmp"] = self.multi_pattern_search(text, patterns)
 
         # Fuzzy regex
         results["fuzzy_regex"] = self.fuzzy_regex_search(text, patterns[0])
@@ -146,9 +294,29 @@ class AdvancedPatternMatcher:
         return results
 
     def parallel_search(self, texts: List[str], pattern: str, n_workers: int = 4) -> List[List[int]]:
-        """Parallel KMP search across multiple texts."""
-        with Pool(n_workers) as pool:
-            return pool.starmap(self.kmp_search, [(t, pattern) for t in texts])
+        """Parallel KMP search across multiple texts (worker pool reused between calls)."""
+        if self._pool is None or self._pool_workers != n_workers:
+            self.close()
+            self._pool = Pool(n_workers)
+            self._pool_workers = n_workers
+        return self._pool.starmap(self.kmp_search, [(t, pattern) for t in texts])
+
+    def close(self):
+        """Shut down the worker pool (if one was started)."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+            self._pool_workers = 0
+
+    def __getstate__(self):
+        # Pool handles (and the AC automaton) must not travel to workers
+        state = self.__dict__.copy()
+        state['_pool'] = None
+        state['_pool_workers'] = 0
+        state['_ac'] = None
+        state['_ac_patterns'] = ()
+        return state
 
 
 def generate_benchmark_report(matcher: AdvancedPatternMatcher, dataset_size: int = 10000):
@@ -159,8 +327,8 @@ def generate_benchmark_report(matcher: AdvancedPatternMatcher, dataset_size: int
     timings = {}
     for algo, func in [
         ("KMP", lambda: matcher.kmp_search(text, patterns[0])),
-        ("Wildcard", lambda: any(matcher.wildcard_match(text, patterns[1], i, 0) for i in range(100))),
-        ("Motif", lambda: matcher.motif_distance(text, patterns[0], 0, 0))
+        ("Wildcard", lambda: matcher.wildcard_match_all_starts(text, patterns[1])),
+        ("Motif", lambda: matcher.motif_distances_all_starts(text, patterns[0]))
     ]:
         start = time.perf_counter()
         func()
@@ -199,19 +367,15 @@ def interactive_demo():
         if choice == '1':
             text = input("Enter text: ")
             pattern = input("Enter wildcard pattern: ")
-            matches = []
-            for i in range(len(text)):
-                if matcher.wildcard_match(text, pattern, i, 0):
-                    matches.append(i)
+            matches = matcher.wildcard_match_all_starts(text, pattern)
             print(f"Wildcard matches at: {matches}")
 
         elif choice == '2':
             dna = input("Enter DNA sequence: ")
             motif = input("Enter motif: ")
-            for i in range(len(dna) - len(motif) + 1):
-                dist = matcher.motif_distance(dna, motif, i, 0)
-                if dist <= 2:
-                    print(f"Pos {i}: distance={dist}")
+            distances = matcher.motif_distances_all_starts(dna, motif)
+            for i in np.nonzero(distances <= 2)[0]:
+                print(f"Pos {i}: distance={distances[i]}")
 
         elif choice == '4':
             generate_benchmark_report(matcher)
@@ -269,6 +433,7 @@ def main():
         texts = ["AGCT" * 1000] * 8  # Simulate 8 DNA files
         pattern = "GATTACA"
         matches = matcher.parallel_search(texts, pattern)
+        matcher.close()
         print(f"Parallel search completed: {sum(len(m) for m in matches)} total matches")
 
 
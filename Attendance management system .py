@@ -1,3 +1,4 @@
+from collections import defaultdict
 from datetime import datetime
 from typing import List, Dict
 
@@ -35,7 +36,18 @@ class Attendance:
         self.att_id = att_id
         self.course_id = course_id
         self.date = date
-        self.present_students = present_students
+        # Bitset keyed by student_id: O(1) membership, popcount for totals
+        self.present_mask = 0
+        for sid in present_students:
+            self.present_mask |= 1 << sid
+
+    @property
+    def present_students(self) -> List[int]:
+        mask = self.present_mask
+        return [i for i in range(mask.bit_length()) if (mask >> i) & 1]
+
+    def present_count(self) -> int:
+        return self.present_mask.bit_count()
 
 
 class AttendanceManagementSystem:
@@ -44,6 +56,10 @@ class AttendanceManagementSystem:
         self.faculty: List[Faculty] = []
         self.courses: List[Course] = []
         self.attendance: List[Attendance] = []
+        # Lookup indexes kept in sync by add_student/add_course/mark_attendance
+        self._students_by_id: Dict[int, Student] = {}
+        self._course_id_by_name: Dict[str, int] = {}
+        self._attendance_by_course: Dict[int, List[Attendance]] = defaultdict(list)
         self.next_student_id = 1
         self.next_faculty_id = 1
         self.next_course_id = 1
@@ -53,6 +69,7 @@ class AttendanceManagementSystem:
     def add_student(self, name: str, roll_no: str, course: str):
         student = Student(self.next_student_id, name, roll_no, course)
         self.students.append(student)
+        self._students_by_id[student.student_id] = student
         self.next_student_id += 1
         print(f"✅ Student '{name}' added!")
 
@@ -65,11 +82,12 @@ class AttendanceManagementSystem:
     def add_course(self, name: str, faculty_id: int):
         course = Course(self.next_course_id, name, faculty_id)
         self.courses.append(course)
+        self._course_id_by_name[name] = course.course_id
         self.next_course_id += 1
         print(f"✅ Course '{name}' added!")
 
     def enroll_student(self, student_id: int, course_id: int):
-        student = next((s for s in self.students if s.student_id == student_id), None)
+        student = self._students_by_id.get(student_id)
         course = next((c for c in self.courses if c.course_id == course_id), None)
         if student and course:
             course.students.append(student_id)
@@ -86,33 +104,36 @@ class AttendanceManagementSystem:
 
         print(f"\n📚 Students in {course.name}:")
         for sid in course.students:
-            student = next(s for s in self.students if s.student_id == sid)
-            print(f"{sid}. {student.name}")
+            print(f"{sid}. {self._students_by_id[sid].name}")
 
+        roster = set(course.students)  # O(1) membership vs scanning the roster list
         present_ids = []
         while True:
             choice = input("Enter present student ID (0 to finish): ")
             if choice == '0':
                 break
-            if int(choice) in course.students:
-                present_ids.append(int(choice))
+            try:
+                val = int(choice)
+            except ValueError:
+                print("❌ Enter a numeric student ID")
+                continue
+            if val in roster:
+                present_ids.append(val)
 
         date = datetime.now().strftime("%Y-%m-%d")
         att = Attendance(self.next_att_id, course_id, date, present_ids)
         self.attendance.append(att)
+        self._attendance_by_course[course_id].append(att)
         self.next_att_id += 1
 
-        # Update student records
+        # Update student records: one index lookup + setdefault per student
         for sid in course.students:
-            student = next(s for s in self.students if s.student_id == sid)
-            if course.name not in student.attendance_records:
-                student.attendance_records[course.name] = []
-            student.attendance_records[course.name].append(date)
+            self._students_by_id[sid].attendance_records.setdefault(course.name, []).append(date)
 
         print(f"✅ Attendance marked for {len(present_ids)}/{len(course.students)} students")
 
     def view_attendance_report(self, student_id: int):
-        student = next((s for s in self.students if s.student_id == student_id), None)
+        student = self._students_by_id.get(student_id)
         if not student:
             print("❌ Student not found")
             return
@@ -120,9 +141,9 @@ class AttendanceManagementSystem:
         print(f"\n📊 {student.name} Attendance Report:")
         for course, dates in student.attendance_records.items():
             total_classes = len(dates)
-            present = sum(1 for att in self.attendance
-                          if student_id in att.present_students and
-                          att.course_id == next(c.course_id for c in self.courses if c.name == course))
+            cid = self._course_id_by_name.get(course)
+            present = sum((att.present_mask >> student_id) & 1
+                          for att in self._attendance_by_course[cid])
             percentage = (present / total_classes * 100) if total_classes > 0 else 0
             print(f"{course}: {present}/{total_classes} ({percentage:.1f}%)")
 
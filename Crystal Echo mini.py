@@ -1,7 +1,20 @@
 import random
 import os
+import sys
 import time
 
+import numpy as np
+
+
+def _read_command(prompt):
+    """input() on a terminal; buffered readline when stdin is piped."""
+    if sys.stdin.isatty():
+        return input(prompt)
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip('\n')
+
 
 class CrystalEcho:
     def __init__(self):
@@ -15,14 +28,16 @@ class CrystalEcho:
         self.score = 0
 
     def generate_cave(self):
-        cave = [['.' for _ in range(self.width)] for _ in range(self.height)]
+        # Flat byte grid: one uint8 per cell instead of a char object
+        # behind two levels of Python lists
+        cave = np.full((self.height, self.width), ord('.'), dtype=np.uint8)
         # Place crystals and hazards procedurally
         for _ in range(3):
             x, y = random.randint(1, self.width - 2), random.randint(0, self.height - 1)
-            cave[y][x] = 'C'  # Crystal
+            cave[y, x] = ord('C')  # Crystal
         for _ in range(2):
             x, y = random.randint(1, self.width - 2), random.randint(0, self.height - 1)
-            cave[y][x] = 'H'  # Hazard (cave-in risk)
+            cave[y, x] = ord('H')  # Hazard (cave-in risk)
         return cave
 
     def print_cave(self, revealed=False):
@@ -31,17 +46,19 @@ class CrystalEcho:
         print(f"Energy: {self.energy} | Crystals: {self.crystals}/5 | Score: {self.score}")
         print("w=forward, a/d=scan left/right, e=echo (reveals area, costs 2 energy)")
 
+        # One joined frame, one write — instead of per-row concat loops and
+        # a separate print (and syscall) per row; rows decode straight from
+        # the byte grid
+        rows = []
         for y in range(self.height):
-            row = ''
-            for x in range(self.width):
-                if x == self.player_x and y == self.player_y:
-                    row += 'P '
-                elif revealed and self.cave[y][x] != '.':
-                    row += self.cave[y][x] + ' '
-                else:
-                    row += '? '
-            print(row)
-        print()
+            if revealed:
+                row = self.cave[y].tobytes().decode('ascii').replace('.', '?')
+            else:
+                row = '?' * self.width
+            if y == self.player_y:
+                row = row[:self.player_x] + 'P' + row[self.player_x + 1:]
+            rows.append(' '.join(row) + ' ')
+        print('\n'.join(rows) + '\n')
 
     def move(self, dx, dy):
         new_x, new_y = self.player_x + dx, self.player_y + dy
@@ -66,14 +83,14 @@ class CrystalEcho:
         return False
 
     def check_collisions(self):
-        cell = self.cave[self.player_y][self.player_x]
-        if cell == 'C':
+        cell = self.cave[self.player_y, self.player_x]
+        if cell == ord('C'):
             self.crystals += 1
-            self.cave[self.player_y][self.player_x] = '.'
+            self.cave[self.player_y, self.player_x] = ord('.')
             self.score += 50
             print("Crystal collected! +50 score")
             time.sleep(0.5)
-        elif cell == 'H':
+        elif cell == ord('H'):
             self.energy -= 5
             self.score -= 20
             print("Cave-in! Energy drained.")
@@ -83,7 +100,7 @@ class CrystalEcho:
         while not self.game_over and self.energy > 0 and self.crystals < 5:
             self.print_cave(revealed=(self.echo_active if hasattr(self, 'echo_active') else False))
 
-            cmd = input("Command: ").lower()
+            cmd = _read_command("Command: ").lower()
             if cmd == 'q':
                 self.game_over = True
             elif cmd == 'w':
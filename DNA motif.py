@@ -1,42 +1,160 @@
-from typing import List, Tuple
-from functools import lru_cache
+from typing import Dict, List, Tuple
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = NUMPY_AVAILABLE
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _motif_scan_jit(dna_arr, motif_arr, max_mismatches):
+        """Early-exit Hamming scan over uint8 arrays, compiled to native code."""
+        n = dna_arr.shape[0]
+        m = motif_arr.shape[0]
+        out = np.empty((n - m + 1, 2), dtype=np.int64)
+        count = 0
+        for start in range(n - m + 1):
+            mismatches = 0
+            for j in range(m):
+                if dna_arr[start + j] != motif_arr[j]:
+                    mismatches += 1
+                    if mismatches > max_mismatches:
+                        break
+            if mismatches <= max_mismatches:
+                out[count, 0] = start
+                out[count, 1] = mismatches
+                count += 1
+        return out[:count]
+
+    @njit(cache=True)
+    def _motif_bitap_jit(dna_arr, motif_arr, max_mismatches):
+        """Wu-Manber bit-parallel scan: the whole motif is processed per
+        character as machine-word ops on uint64 state words, one word per
+        allowed mismatch level (motifs up to 64 bases)."""
+        n = dna_arr.shape[0]
+        m = motif_arr.shape[0]
+        one = np.uint64(1)
+        # Character masks: bit j set iff motif[j] == byte value
+        masks = np.zeros(256, dtype=np.uint64)
+        for j in range(m):
+            masks[motif_arr[j]] |= one << np.uint64(j)
+        accept = one << np.uint64(m - 1)
+        # R[k]: bit j set iff motif[:j+1] matches ending here with <= k mismatches
+        R = np.zeros(max_mismatches + 1, dtype=np.uint64)
+        out = np.empty((n, 2), dtype=np.int64)
+        count = 0
+        for i in range(n):
+            cmask = masks[dna_arr[i]]
+            prev = R[0]
+            R[0] = ((R[0] << one) | one) & cmask
+            for k in range(1, max_mismatches + 1):
+                cur = R[k]
+                # Exact-extend OR substitute this base (costs one mismatch)
+                R[k] = (((cur << one) | one) & cmask) | ((prev << one) | one)
+                prev = cur
+            # Smallest k with the accept bit set = mismatch count here
+            for k in range(max_mismatches + 1):
+                if R[k] & accept:
+                    out[count, 0] = i - m + 1
+                    out[count, 1] = k
+                    count += 1
+                    break
+        return out[:count]
+
+
+def _find_motifs_numpy(dna: str, motif: str, max_mismatches: int) -> List[Tuple[int, int]]:
+    """Mismatch counts for every start at once: zero-copy length-m windows
+    over the DNA bytes, one vectorized comparison and reduction."""
+    dna_arr = np.frombuffer(dna.encode(), dtype=np.uint8)
+    motif_arr = np.frombuffer(motif.encode(), dtype=np.uint8)
+    windows = np.lib.stride_tricks.sliding_window_view(dna_arr, motif_arr.shape[0])
+    mismatches = (windows != motif_arr).sum(axis=1)
+    return [(int(i), int(mismatches[i]))
+            for i in np.flatnonzero(mismatches <= max_mismatches)]
+
+
+def _find_motifs_scan(dna: str, motif: str, max_mismatches: int) -> List[Tuple[int, int]]:
+    """Plain O(n·m) scan with early exit once a window exceeds the budget."""
+    n, m = len(dna), len(motif)
+    results = []
+    for start in range(n - m + 1):
+        mismatches = 0
+        for j in range(m):
+            if dna[start + j] != motif[j]:
+                mismatches += 1
+                if mismatches > max_mismatches:
+                    break
+        else:
+            results.append((start, mismatches))
+    return results
 
 
 def find_dna_motifs(dna: str, motif: str, max_mismatches: int = 2) -> List[Tuple[int, int]]:
     """
-    Find all occurrences of motif in DNA allowing up to max_mismatches.
-    Returns list of (start_index, mismatch_count) tuples.
+    Find all occurrences of motif in DNA allowing up to max_mismatches
+    (Hamming distance). Returns list of (start_index, mismatch_count) tuples.
+
+    Dispatches to a Numba-compiled scan when available, then to the
+    vectorized numpy pass, then to the dependency-free early-exit scan.
     """
-    n, m = len(dna), len(motif)
-    results = []
+    if len(motif) == 0 or len(dna) < len(motif):
+        return []
 
-    @lru_cache(maxsize=None)
-    def min_mismatches(i: int, j: int) -> int:
-        """
-        Recursive DP: minimum mismatches needed to match dna[i:] with motif[j:].
-        Memoized to avoid recomputing repetitive DNA segments.
-        """
-        # Base cases
-        if j == m:  # Finished motif
-            return 0
-        if i + m - j > n:  # Not enough DNA left
-            return float('inf')
+    if dna.isascii() and motif.isascii():
+        if NUMBA_AVAILABLE:
+            dna_arr = np.frombuffer(dna.encode(), dtype=np.uint8)
+            motif_arr = np.frombuffer(motif.encode(), dtype=np.uint8)
+            if len(motif) <= 64:  # bit-parallel state fits one machine word
+                hits = _motif_bitap_jit(dna_arr, motif_arr, max_mismatches)
+            else:
+                hits = _motif_scan_jit(dna_arr, motif_arr, max_mismatches)
+            return [(int(s), int(d)) for s, d in hits]
+        if NUMPY_AVAILABLE:
+            return _find_motifs_numpy(dna, motif, max_mismatches)
 
-        # Current position match/mismatch
-        mismatch = 0 if dna[i] == motif[j] else 1
+    return _find_motifs_scan(dna, motif, max_mismatches)
 
-        # Two choices: match current chars OR skip this DNA position (backtrack)
-        match_here = mismatch + min_mismatches(i + 1, j + 1)
-        skip_dna = min_mismatches(i + 1, j)
 
-        return min(match_here, skip_dna)
+def find_dna_motifs_batch(dna: str, motifs: List[str],
+                          max_mismatches: int = 2) -> Dict[str, List[Tuple[int, int]]]:
+    """
+    Search many motifs against the same DNA at once. Returns
+    {motif: [(start_index, mismatch_count), ...]}.
 
-    # Scan DNA for valid motif positions
-    for start in range(n - m + 1):
-        mismatches = min_mismatches(start, 0)
-        if mismatches <= max_mismatches:
-            results.append((start, mismatches))
+    Motifs are grouped by length, packed into one array per group and
+    broadcast against the shared window view — a single vectorized
+    comparison per distinct length instead of one scan per motif.
+    """
+    results: Dict[str, List[Tuple[int, int]]] = {motif: [] for motif in motifs}
+    if not (NUMPY_AVAILABLE and dna.isascii() and all(mo.isascii() for mo in motifs)):
+        for motif in motifs:
+            results[motif] = find_dna_motifs(dna, motif, max_mismatches)
+        return results
+
+    dna_arr = np.frombuffer(dna.encode(), dtype=np.uint8)
+    by_length: Dict[int, List[str]] = {}
+    for motif in motifs:
+        if 0 < len(motif) <= len(dna):
+            by_length.setdefault(len(motif), []).append(motif)
 
+    for m, group in by_length.items():
+        windows = np.lib.stride_tricks.sliding_window_view(dna_arr, m)
+        packed = np.frombuffer(''.join(group).encode(),
+                               dtype=np.uint8).reshape(len(group), m)
+        # (n-m+1, 1, m) vs (1, G, m) -> (n-m+1, G) mismatch counts in one pass
+        mismatches = (windows[:, None, :] != packed[None, :, :]).sum(axis=2)
+        for g, motif in enumerate(group):
+            col = mismatches[:, g]
+            results[motif] = [(int(i), int(col[i]))
+                              for i in np.flatnonzero(col <= max_mismatches)]
     return results
 
 
@@ -1,4 +1,23 @@
+import sys
+from array import array
+
+import numpy as np
+
+
+def _prompt(text):
+    """Menu input: input() on a TTY, buffered stdin reads for scripted runs."""
+    if sys.stdin.isatty():
+        return input(text)
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip('\n')
+
+
 class Book:
+    # Fixed attribute layout: no per-instance __dict__, faster attribute access
+    __slots__ = ('book_id', 'title', 'author', 'isbn', 'price', 'status', '_search')
+
     def __init__(self, book_id, title, author, isbn, price, status="Available"):
         self.book_id = book_id
         self.title = title
@@ -6,24 +25,30 @@ class Book:
         self.isbn = isbn
         self.price = price
         self.status = status
+        # Lowercased searchable field, built once at insertion time
+        self._search = f"{title}|{author}".lower()
 
     def __str__(self):
         return f"ID: {self.book_id}, {self.title} by {self.author} [{self.status}]"
 
 
 class User:
+    __slots__ = ('user_id', 'name', 'email', 'phone', 'borrowed_books')
+
     def __init__(self, user_id, name, email, phone):
         self.user_id = user_id
         self.name = name
         self.email = email
         self.phone = phone
-        self.borrowed_books = []
+        self.borrowed_books = array('i')  # packed ints, not a list of objects
 
     def __str__(self):
         return f"ID: {self.user_id}, {self.name} ({self.email})"
 
 
 class Transaction:
+    __slots__ = ('trans_id', 'user_id', 'book_id', 'issue_date', 'return_date', 'fine')
+
     def __init__(self, trans_id, user_id, book_id, issue_date, return_date=None, fine=0):
         self.trans_id = trans_id
         self.user_id = user_id
@@ -35,23 +60,28 @@ class Transaction:
 
 class LibraryManagementSystem:
     def __init__(self):
-        self.books = []
-        self.users = []
-        self.transactions = []
+        # id -> object maps: every lookup is a single O(1) hash instead of a scan
+        self.books = {}
+        self.users = {}
+        self.transactions = {}
         self.next_book_id = 1
         self.next_user_id = 1
         self.next_trans_id = 1
+        # Search index (numpy array of Book._search), rebuilt lazily on change
+        self._search_arr = None
+        self._search_ids = []
 
     # ADMIN OPERATIONS
     def add_book(self, title, author, isbn, price):
         book = Book(self.next_book_id, title, author, isbn, price)
-        self.books.append(book)
+        self.books[self.next_book_id] = book
         self.next_book_id += 1
+        self._search_arr = None  # invalidate the search index
         print(f"✅ Book '{title}' added successfully!")
 
     def register_user(self, name, email, phone):
         user = User(self.next_user_id, name, email, phone)
-        self.users.append(user)
+        self.users[self.next_user_id] = user
         self.next_user_id += 1
         print(f"✅ User '{name}' registered!")
 
@@ -60,7 +90,7 @@ class LibraryManagementSystem:
             print("📚 No books available")
             return
         print("\n📚 ALL BOOKS:")
-        for book in self.books:
+        for book in self.books.values():
             print(book)
 
     def list_users(self):
@@ -68,13 +98,22 @@ class LibraryManagementSystem:
             print("👥 No users registered")
             return
         print("\n👥 ALL USERS:")
-        for user in self.users:
+        for user in self.users.values():
             print(user)
 
     # USER OPERATIONS
     def search_book(self, title_or_author):
-        results = [b for b in self.books if title_or_author.lower() in
-                   (b.title.lower() or b.author.lower())]
+        # Substring match on title OR author (the old `or` between the two
+        # lowered strings short-circuited to the title and never checked
+        # the author), done in one vectorized C pass over all books
+        q = title_or_author.lower()
+        if self._search_arr is None:
+            self._search_ids = list(self.books)
+            self._search_arr = np.array([b._search for b in self.books.values()])
+        results = []
+        if self._search_ids:
+            hits = np.char.find(self._search_arr, q) >= 0
+            results = [self.books[self._search_ids[i]] for i in np.flatnonzero(hits)]
         if results:
             print(f"\n🔍 SEARCH RESULTS for '{title_or_author}':")
             for book in results:
@@ -83,8 +122,8 @@ class LibraryManagementSystem:
             print("❌ No books found")
 
     def issue_book(self, user_id, book_id):
-        user = next((u for u in self.users if u.user_id == user_id), None)
-        book = next((b for b in self.books if b.book_id == book_id), None)
+        user = self.users.get(user_id)
+        book = self.books.get(book_id)
 
         if not user or not book:
             print("❌ Invalid User ID or Book ID")
@@ -96,7 +135,7 @@ class LibraryManagementSystem:
 
         # Create transaction
         trans = Transaction(self.next_trans_id, user_id, book_id, "2026-01-29")
-        self.transactions.append(trans)
+        self.transactions[self.next_trans_id] = trans
         self.next_trans_id += 1
 
         book.status = "Issued"
@@ -105,12 +144,12 @@ class LibraryManagementSystem:
         print(f"✅ Book issued to {user.name}")
 
     def return_book(self, trans_id):
-        trans = next((t for t in self.transactions if t.trans_id == trans_id), None)
+        trans = self.transactions.get(trans_id)
         if not trans:
             print("❌ Invalid Transaction ID")
             return
 
-        book = next((b for b in self.books if b.book_id == trans.book_id), None)
+        book = self.books.get(trans.book_id)
         if not book:
             print("❌ Book not found")
             return
@@ -120,22 +159,21 @@ class LibraryManagementSystem:
         trans.fine = 5.0  # Example fine
 
         # Remove from user's borrowed list
-        user = next(u for u in self.users if u.user_id == trans.user_id)
+        user = self.users[trans.user_id]
         if trans.book_id in user.borrowed_books:
             user.borrowed_books.remove(trans.book_id)
 
         print(f"✅ Book returned. Fine: ${trans.fine}")
 
     def show_user_books(self, user_id):
-        user = next((u for u in self.users if u.user_id == user_id), None)
+        user = self.users.get(user_id)
         if not user:
             print("❌ User not found")
             return
 
         print(f"\n📖 Books borrowed by {user.name}:")
         for book_id in user.borrowed_books:
-            book = next(b for b in self.books if b.book_id == book_id)
-            print(f"  - {book}")
+            print(f"  - {self.books[book_id]}")
 
     # DISPLAY MENU
     def display_menu(self):
@@ -156,19 +194,19 @@ class LibraryManagementSystem:
     def run(self):
         while True:
             self.display_menu()
-            choice = input("Enter choice (0-8): ").strip()
+            choice = _prompt("Enter choice (0-8): ").strip()
 
             if choice == '1':
-                title = input("Book Title: ")
-                author = input("Author: ")
-                isbn = input("ISBN: ")
-                price = float(input("Price: "))
+                title = _prompt("Book Title: ")
+                author = _prompt("Author: ")
+                isbn = _prompt("ISBN: ")
+                price = float(_prompt("Price: "))
                 self.add_book(title, author, isbn, price)
 
             elif choice == '2':
-                name = input("User Name: ")
-                email = input("Email: ")
-                phone = input("Phone: ")
+                name = _prompt("User Name: ")
+                email = _prompt("Email: ")
+                phone = _prompt("Phone: ")
                 self.register_user(name, email, phone)
 
             elif choice == '3':
@@ -178,20 +216,20 @@ class LibraryManagementSystem:
                 self.list_users()
 
             elif choice == '5':
-                search_term = input("Search by title/author: ")
+                search_term = _prompt("Search by title/author: ")
                 self.search_book(search_term)
 
             elif choice == '6':
-                user_id = int(input("User ID: "))
-                book_id = int(input("Book ID: "))
+                user_id = int(_prompt("User ID: "))
+                book_id = int(_prompt("Book ID: "))
                 self.issue_book(user_id, book_id)
 
             elif choice == '7':
-                trans_id = int(input("Transaction ID: "))
+                trans_id = int(_prompt("Transaction ID: "))
                 self.return_book(trans_id)
 
             elif choice == '8':
-                user_id = int(input("User ID: "))
+                user_id = int(_prompt("User ID: "))
                 self.show_user_books(user_id)
 
             elif choice == '0':
@@ -201,7 +239,7 @@ class LibraryManagementSystem:
             else:
                 print("❌ Invalid choice!")
 
-            input("\nPress Enter to continue...")
+            _prompt("\nPress Enter to continue...")
 
 
 # RUN THE SYSTEM
@@ -1,4 +1,15 @@
 import random
+import sys
+
+
+def read_guess(prompt):
+    """Read one line: input() when interactive, raw readline for piped replays."""
+    if sys.stdin.isatty():
+        return input(prompt)
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip('\n')
 
 
 def generate_code():
@@ -8,15 +19,35 @@ def generate_code():
     return ''.join(digits[:4])
 
 
-def get_feedback(secret, guess):
-    """Return feedback: correct position (A), wrong position (B)."""
-    a_count = sum(1 for i in range(4) if guess[i] == secret[i])
-    b_count = sum(1 for digit in guess if digit in secret) - a_count
+def code_mask(code):
+    """6-bit presence mask for a code: digit d sets bit d-1."""
+    mask = 0
+    for c in code:
+        mask |= 1 << (ord(c) - 49)  # ord('1') == 49
+    return mask
+
+
+def get_feedback(secret, guess, secret_mask=None):
+    """Return feedback: correct position (A), wrong position (B).
+
+    Branchless bitmask version: digits are 1-6 and never repeat, so each
+    code is a 6-bit mask and b_count is a popcount of the mask overlap
+    instead of a per-digit `in secret` scan.
+    """
+    if secret_mask is None:
+        secret_mask = code_mask(secret)
+    guess_mask = 0
+    a_count = 0
+    for i in range(4):
+        guess_mask |= 1 << (ord(guess[i]) - 49)
+        a_count += guess[i] == secret[i]
+    b_count = (guess_mask & secret_mask).bit_count() - a_count
     return f"{a_count}A{b_count}B"
 
 
 def play_game():
     secret = generate_code()
+    secret_mask = code_mask(secret)  # computed once per game
     score = 100  # Starting score
     attempts = 0
     max_attempts = 10
@@ -26,7 +57,7 @@ def play_game():
     print("Feedback: XA YB (X=correct position, Y=present but wrong spot)\n")
 
     while attempts < max_attempts:
-        guess = input(f"Attempt {attempts + 1}/{max_attempts} - Enter guess: ").strip()
+        guess = read_guess(f"Attempt {attempts + 1}/{max_attempts} - Enter guess: ").strip()
 
         if len(guess) != 4 or not guess.isdigit():
             print("❌ Invalid: Must be 4 digits (1-6). Try again.\n")
@@ -38,7 +69,7 @@ def play_game():
             continue
 
         attempts += 1
-        feedback = get_feedback(secret, guess)
+        feedback = get_feedback(secret, guess, secret_mask)
         print(f"Feedback: {feedback}")
 
         if feedback == "4A0B":
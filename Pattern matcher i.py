@@ -1,37 +1,35 @@
-def wildcard_match(text: str, pattern: str) -> bool:
-    memo = {}
-
-    def dfs(i: int, j: int) -> bool:
-        # i: current position in text, j: current position in pattern
-        if (i, j) in memo:
-            return memo[(i, j)]
-
-        # Base case: end of both text and pattern
-        if i == len(text) and j == len(pattern):
-            return True
-
-        # Base case: end of text but not pattern (unless remaining pattern is all '*')
-        if i == len(text):
-            return all(c == '*' for c in pattern[j:])
+import numpy as np
 
-        # Base case: end of pattern but not text
-        if j == len(pattern):
-            return False
 
-        # Current pattern char handling
-        if pattern[j] == '*':
-            # '*' matches zero or more chars: try zero (skip '*') or one+ (skip text char)
-            match = dfs(i, j + 1) or (i < len(text) and dfs(i + 1, j))
-        elif pattern[j] == '?' or pattern[j] == text[i]:
-            # '?' matches any single char, or literal match
-            match = dfs(i + 1, j + 1)
+def wildcard_match(text: str, pattern: str) -> bool:
+    # Iterative bottom-up DP, one numpy column per pattern position.
+    # col[i] = pattern[j:] matches text[i:], computed from column j+1.
+    n, m = len(text), len(pattern)
+    if text.isascii():
+        text_arr = np.frombuffer(text.encode(), dtype=np.uint8)
+    else:
+        text_arr = np.array([ord(c) for c in text], dtype=np.int64)
+
+    col = np.zeros(n + 1, dtype=bool)
+    col[n] = True  # empty pattern matches only empty remaining text
+
+    for j in range(m - 1, -1, -1):
+        pc = pattern[j]
+        if pc == '*':
+            # '*' matches zero or more chars: col[i] = OR of col[i:] from column j+1
+            # (reverse cumulative OR, vectorized over the whole column)
+            col = np.flip(np.logical_or.accumulate(np.flip(col)))
         else:
-            match = False
-
-        memo[(i, j)] = match
-        return match
-
-    return dfs(0, 0)
+            new = np.zeros(n + 1, dtype=bool)
+            if pc == '?':
+                # '?' matches any single char
+                new[:n] = col[1:]
+            else:
+                # literal match against the whole text at once
+                new[:n] = (text_arr == ord(pc)) & col[1:]
+            col = new
+
+    return bool(col[0])
 
 
 # Test cases
@@ -1,10 +1,36 @@
 import random
-from typing import List, Optional
+import sys
+from typing import Optional, Tuple
+
+
+def _read_move(prompt):
+    """Read the player's move: input() when interactive, readline when piped."""
+    if sys.stdin.isatty():
+        return input(prompt)
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip('\n')
+
+# Search order: center > corners > edges
+MOVE_ORDER = (4, 0, 2, 6, 8, 1, 3, 5, 7)
+# Empty squares for each of the 512 occupancy masks, precomputed once —
+# available_moves becomes a single index with no per-call allocation
+EMPTIES = tuple(tuple(i for i in MOVE_ORDER if not (m >> i) & 1)
+                for m in range(512))
 
 
 class TicTacToe:
+    # Rows, columns and diagonals as 9-bit masks over board positions 0-8
+    WIN_MASKS = (0b000000111, 0b000111000, 0b111000000,
+                 0b001001001, 0b010010010, 0b100100100,
+                 0b100010001, 0b001010100)
+    FULL_MASK = 0b111111111
+
     def __init__(self):
-        self.board = [' '] * 9
+        self.board = [' '] * 9  # char view, kept for display
+        self.x_mask = 0  # 9-bit occupancy masks, updated incrementally
+        self.o_mask = 0
         self.current_player = 'X'  # Player starts
         self.ai_player = 'O'
         self.player_stats = {'aggressive': 0, 'defensive': 0, 'center_bias': 0}
@@ -15,24 +41,30 @@ class TicTacToe:
             print(f"{self.board[i]} | {self.board[i + 1]} | {self.board[i + 2]}")
             if i < 6: print("---------")
 
-    def available_moves(self) -> List[int]:
-        return [i for i, spot in enumerate(self.board) if spot == ' ']
+    def available_moves(self) -> Tuple[int, ...]:
+        return EMPTIES[self.x_mask | self.o_mask]
 
     def make_move(self, position: int, player: str) -> bool:
-        if self.board[position] == ' ':
+        bit = 1 << position
+        if not ((self.x_mask | self.o_mask) & bit):
             self.board[position] = player
+            if player == 'X':
+                self.x_mask |= bit
+            else:
+                self.o_mask |= bit
             self.current_player = 'O' if player == 'X' else 'X'
             self.game_stats['moves'] += 1
             return True
         return False
 
     def check_winner(self) -> Optional[str]:
-        # Rows, columns, diagonals
-        lines = [(0, 1, 2), (3, 4, 5), (6, 7, 8), (0, 3, 6), (1, 4, 7), (2, 5, 8), (0, 4, 8), (2, 4, 6)]
-        for a, b, c in lines:
-            if self.board[a] == self.board[b] == self.board[c] != ' ':
-                return self.board[a]
-        return 'Draw' if ' ' not in self.board else None
+        # One AND+compare per line instead of three char equality checks
+        for w in self.WIN_MASKS:
+            if self.x_mask & w == w:
+                return 'X'
+            if self.o_mask & w == w:
+                return 'O'
+        return 'Draw' if (self.x_mask | self.o_mask) == self.FULL_MASK else None
 
     def update_player_stats(self, move: int):
         """AI learns player patterns"""
@@ -66,17 +98,17 @@ class TicTacToe:
         if is_maximizing:
             best_score = float('-inf')
             for move in self.available_moves():
-                self.board[move] = self.ai_player
+                self.o_mask |= 1 << move  # masks only — board stays untouched
                 score = self.minimax(depth + 1, False)
-                self.board[move] = ' '
+                self.o_mask ^= 1 << move
                 best_score = max(score, best_score)
             return best_score
         else:
             best_score = float('inf')
             for move in self.available_moves():
-                self.board[move] = 'X'
+                self.x_mask |= 1 << move
                 score = self.minimax(depth + 1, True)
-                self.board[move] = ' '
+                self.x_mask ^= 1 << move
                 best_score = min(score, best_score)
             return best_score
 
@@ -87,10 +119,10 @@ class TicTacToe:
 
         # Prioritize center and adapt to player style
         center = 4
-        if self.board[center] == ' ':
-            self.board[center] = self.ai_player
+        if not ((self.x_mask | self.o_mask) >> center) & 1:
+            self.o_mask |= 1 << center
             score = self.minimax(0, False)
-            self.board[center] = ' '
+            self.o_mask ^= 1 << center
             if score > best_score:
                 best_score = score
                 best_move = center
@@ -98,9 +130,9 @@ class TicTacToe:
         for move in self.available_moves():
             if move == best_move: continue
 
-            self.board[move] = self.ai_player
+            self.o_mask |= 1 << move
             score = self.minimax(0, False)
-            self.board[move] = ' '
+            self.o_mask ^= 1 << move
 
             # Adapt to player patterns
             if self.player_stats['aggressive'] > self.player_stats['defensive']:
@@ -125,7 +157,7 @@ def play_game():
         # Player turn
         while True:
             try:
-                move = int(input(f"\nYour move (0-8): "))
+                move = int(_read_move(f"\nYour move (0-8): "))
                 if 0 <= move <= 8 and game.make_move(move, 'X'):
                     game.update_player_stats(move)
                     break
@@ -138,7 +170,7 @@ def play_game():
             game.print_board()
             if result == 'X':
                 print("🎉 YOU WIN! (Extremely rare against Minimax)")
-            elif result == self.ai_player:
+            elif result == 'O':
                 print("🤖 AI WINS! (Minimax is unbeatable)")
                 game.game_stats['ai_wins'] += 1
             else: